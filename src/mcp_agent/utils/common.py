@@ -10,9 +10,32 @@ from typing import Any, List, Callable, TypeVar
 
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 R = TypeVar("R")
 
 
+def json_dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string, using orjson when installed (the
+    "perf" extra) for a several-fold speedup on hot paths that serialize per
+    fan-out agent, and falling back to the stdlib otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Deserialize JSON with orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def unwrap(c: Callable[..., Any]) -> Callable[..., Any]:
     """Return the underlying function object for any callable."""
     while True:
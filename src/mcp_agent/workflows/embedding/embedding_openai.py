@@ -1,3 +1,4 @@
+from asyncio import gather
 from typing import List, Optional, TYPE_CHECKING
 
 from numpy import array, float32, stack
@@ -11,6 +12,7 @@ from mcp_agent.tracing.semconv import (
 )
 from mcp_agent.tracing.telemetry import get_tracer
 from mcp_agent.workflows.embedding.embedding_base import EmbeddingModel, FloatArray
+from mcp_agent.workflows.llm.dynamic_batcher import AsyncDynamicBatcher
 
 if TYPE_CHECKING:
     from mcp_agent.core.context import Context
@@ -20,8 +22,19 @@ class OpenAIEmbeddingModel(EmbeddingModel):
     """OpenAI embedding model implementation"""
 
     def __init__(
-        self, model: str = "text-embedding-3-small", context: Optional["Context"] = None
+        self,
+        model: str = "text-embedding-3-small",
+        dynamic_batching: bool = False,
+        max_batch_size: int = 32,
+        batch_wait_timeout_s: float = 0.002,
+        context: Optional["Context"] = None,
     ):
+        """
+        Initialize the embedding model. If dynamic_batching is True, concurrent
+        embed() calls are coalesced into a single API request (waiting up to
+        batch_wait_timeout_s for up to max_batch_size texts), which amortizes
+        request overhead and rate-limit slots across callers.
+        """
         super().__init__(context=context)
         self.client = OpenAI(api_key=self.context.config.openai.api_key)
         self.model = model
@@ -31,7 +44,27 @@ class OpenAIEmbeddingModel(EmbeddingModel):
             "text-embedding-3-large": 3072,
         }[model]
 
+        self._batcher: AsyncDynamicBatcher | None = None
+        if dynamic_batching:
+            self._batcher = AsyncDynamicBatcher(
+                flush=self._flush_embeddings,
+                max_batch_size=max_batch_size,
+                batch_wait_timeout_s=batch_wait_timeout_s,
+            )
+
     async def embed(self, data: List[str]) -> FloatArray:
+        if self._batcher is not None:
+            rows = await gather(*(self._batcher.submit(text) for text in data))
+            return stack(rows)
+
+        return await self._embed_request(data)
+
+    async def _flush_embeddings(self, batch: List[str]) -> List[FloatArray]:
+        """Service one coalesced batch of texts with a single embeddings request."""
+        embeddings = await self._embed_request(batch)
+        return [embeddings[i] for i in range(len(batch))]
+
+    async def _embed_request(self, data: List[str]) -> FloatArray:
         tracer = get_tracer(self.context)
         with tracer.start_as_current_span(f"{self.__class__.__name__}.embed") as span:
             span.set_attribute(GEN_AI_REQUEST_MODEL, self.model)
@@ -78,15 +78,22 @@ class EmbeddingIntentClassifier(IntentClassifier):
         if self.initialized:
             return
 
-        for intent in self.intents.values():
+        # Embed every intent's texts in a single batched request instead of
+        # one call per intent, then slice the result matrix back per intent
+        intents = list(self.intents.values())
+        all_texts: List[str] = []
+        offsets: List[int] = []
+        for intent in intents:
             # Combine all text for a rich intent representation
-            intent_texts = [intent.name, intent.description] + intent.examples
+            offsets.append(len(all_texts))
+            all_texts.extend([intent.name, intent.description] + intent.examples)
+        offsets.append(len(all_texts))
 
-            # Get embeddings for all texts
-            embeddings = await self.embedding_model.embed(intent_texts)
+        embeddings = await self.embedding_model.embed(all_texts)
 
-            # Use mean pooling to combine embeddings
-            embedding = mean(embeddings, axis=0)
+        for i, intent in enumerate(intents):
+            # Use mean pooling to combine this intent's embeddings
+            embedding = mean(embeddings[offsets[i] : offsets[i + 1]], axis=0)
 
             # Create intents with embeddings
             self.intents[intent.name] = EmbeddingIntent(
@@ -3,12 +3,14 @@ from pydantic import BaseModel
 
 from mcp_agent.tracing.semconv import GEN_AI_REQUEST_TOP_K
 from mcp_agent.tracing.telemetry import get_tracer, record_attributes
-from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM
+from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM, RequestParams
+from mcp_agent.workflows.llm.response_cache import ResponseCache
 from mcp_agent.workflows.intent_classifier.intent_classifier_base import (
     Intent,
     IntentClassifier,
     IntentClassificationResult,
 )
+from mcp_agent.workflows.intent_classifier.semantic_cache import SemanticCache
 
 if TYPE_CHECKING:
     from mcp_agent.core.context import Context
@@ -75,12 +77,27 @@ class LLMIntentClassifier(IntentClassifier):
         llm: AugmentedLLM,
         intents: List[Intent],
         classification_instruction: str | None = None,
+        response_cache: ResponseCache | None = None,
+        semantic_cache: SemanticCache | None = None,
         context: Optional["Context"] = None,
         **kwargs,
     ):
+        """
+        Initialize the classifier with an LLM and the intents to classify against.
+        If response_cache is provided, classification responses are cached by the
+        exact rendered prompt, so repeated identical requests skip the LLM call.
+        If semantic_cache is provided, near-duplicate requests (by embedding
+        similarity) also reuse a prior classification instead of calling the LLM.
+        Classification prompts are fully self-contained, so classify() always
+        runs the LLM with history disabled; this keeps cached responses sound
+        and lets the same LLM instance serve many classifiers.
+        """
         super().__init__(intents=intents, context=context, **kwargs)
         self.llm = llm
         self.classification_instruction = classification_instruction
+        self.response_cache = response_cache
+        self.semantic_cache = semantic_cache
+        self._rendered_context: str | None = None
 
     @classmethod
     async def create(
@@ -88,6 +105,8 @@ class LLMIntentClassifier(IntentClassifier):
         llm: AugmentedLLM,
         intents: List[Intent],
         classification_instruction: str | None = None,
+        response_cache: ResponseCache | None = None,
+        semantic_cache: SemanticCache | None = None,
     ) -> "LLMIntentClassifier":
         """
         Factory method to create and initialize a classifier.
@@ -97,6 +116,8 @@ class LLMIntentClassifier(IntentClassifier):
             llm=llm,
             intents=intents,
             classification_instruction=classification_instruction,
+            response_cache=response_cache,
+            semantic_cache=semantic_cache,
         )
         await instance.initialize()
         return instance
@@ -143,10 +164,47 @@ class LLMIntentClassifier(IntentClassifier):
 
             span.set_attribute("prompt", prompt)
 
-            # Get classification from LLM
-            response = await self.llm.generate_structured(
-                message=prompt, response_model=StructuredIntentResponse
-            )
+            cache_key: str | None = None
+            response: StructuredIntentResponse | None = None
+            if self.response_cache:
+                # Key on the resolved model too, so processes sharing a
+                # cache_dir with different configured models don't collide
+                default_params = getattr(self.llm, "default_request_params", None)
+                cache_key = ResponseCache.make_key(
+                    prompt,
+                    top_k,
+                    self.llm.instruction or "",
+                    default_params.model if default_params else "",
+                )
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    span.set_attribute("cache_hit", True)
+                    response = StructuredIntentResponse.model_validate(cached)
+
+            query_embedding = None
+            if response is None and self.semantic_cache:
+                query_embedding, semantic_hit = await self.semantic_cache.lookup(
+                    request
+                )
+                if semantic_hit is not None:
+                    span.set_attribute("semantic_cache_hit", True)
+                    response = semantic_hit
+
+            if response is None:
+                # Get classification from LLM. The prompt is fully
+                # self-contained, so run without history: the result stays a
+                # pure function of the prompt (making the caches sound) and
+                # the LLM instance accumulates no per-request state.
+                response = await self.llm.generate_structured(
+                    message=prompt,
+                    response_model=StructuredIntentResponse,
+                    request_params=RequestParams(use_history=False),
+                )
+
+                if cache_key is not None and response is not None:
+                    self.response_cache.set(cache_key, response.model_dump(mode="json"))
+                if query_embedding is not None and response is not None:
+                    self.semantic_cache.add(query_embedding, response)
 
             if self.context.tracing_enabled:
                 response_event_data = {}
@@ -221,10 +279,22 @@ class LLMIntentClassifier(IntentClassifier):
         return attributes
 
     def _generate_context(self) -> str:
-        """Generate a formatted context string describing all intents"""
+        """
+        Generate a formatted context string describing all intents.
+
+        The intent set is fixed at construction, so the (potentially large)
+        rendered table is memoized and reused across classify() calls instead
+        of being rebuilt per request.
+        """
+        if self._rendered_context is not None:
+            return self._rendered_context
+
         context_parts = []
 
-        for idx, intent in enumerate(self.intents.values(), 1):
+        # Sort intents by name so the rendered prompt prefix is byte-stable
+        # across calls and processes, maximizing provider prompt-cache hits
+        intents = sorted(self.intents.values(), key=lambda intent: intent.name)
+        for idx, intent in enumerate(intents, 1):
             description = (
                 f"{idx}. Intent: {intent.name}\nDescription: {intent.description}"
             )
@@ -241,4 +311,5 @@ class LLMIntentClassifier(IntentClassifier):
 
             context_parts.append(description)
 
-        return "\n\n".join(context_parts)
+        self._rendered_context = "\n\n".join(context_parts)
+        return self._rendered_context
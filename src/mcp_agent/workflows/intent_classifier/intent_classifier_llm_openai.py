@@ -1,10 +1,13 @@
+import functools
 from typing import List, Optional, TYPE_CHECKING
 
 from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
+from mcp_agent.workflows.llm.response_cache import ResponseCache
 from mcp_agent.workflows.intent_classifier.intent_classifier_base import Intent
 from mcp_agent.workflows.intent_classifier.intent_classifier_llm import (
     LLMIntentClassifier,
 )
+from mcp_agent.workflows.intent_classifier.semantic_cache import SemanticCache
 
 if TYPE_CHECKING:
     from mcp_agent.core.context import Context
@@ -15,6 +18,26 @@ You are provided with a request and a list of intents to choose from.
 You can choose one or more intents, or choose none if no intent is appropriate.
 """
 
+PROMPT_CACHE_KEY = "mcp-agent-intent-classifier-v1"
+"""Stable routing key for OpenAI server-side prompt caching."""
+
+
+@functools.lru_cache(maxsize=32)
+def _get_shared_openai_llm(instruction: str) -> OpenAIAugmentedLLM:
+    """
+    Return a shared OpenAIAugmentedLLM for the given instruction. Constructing
+    an LLM sets up an HTTP client and connection pool, which is wasteful (and
+    leaks sockets) when long-running servers create a classifier per request;
+    classifiers that don't need a dedicated name or context reuse one instance.
+    """
+    llm = OpenAIAugmentedLLM(instruction=instruction)
+    # The instance (including its single history) is shared across every
+    # classifier built this way, so it must stay stateless: classification
+    # requests must never read or append to a conversation shared with
+    # other callers. classify() also pins use_history=False per call.
+    llm.default_request_params.use_history = False
+    return llm
+
 
 class OpenAILLMIntentClassifier(LLMIntentClassifier):
     """
@@ -27,17 +50,39 @@ class OpenAILLMIntentClassifier(LLMIntentClassifier):
         classification_instruction: str | None = None,
         name: str | None = None,
         llm: OpenAIAugmentedLLM | None = None,
+        response_cache: ResponseCache | None = None,
+        semantic_cache: SemanticCache | None = None,
         context: Optional["Context"] = None,
         **kwargs,
     ):
-        openai_llm = llm or OpenAIAugmentedLLM(
-            name=name, instruction=CLASSIFIER_SYSTEM_INSTRUCTION, context=context
-        )
+        if llm is not None:
+            openai_llm = llm
+        elif name is None and context is None:
+            # Nothing instance-specific requested; reuse the pooled LLM
+            openai_llm = _get_shared_openai_llm(CLASSIFIER_SYSTEM_INSTRUCTION)
+        else:
+            openai_llm = OpenAIAugmentedLLM(
+                name=name, instruction=CLASSIFIER_SYSTEM_INSTRUCTION, context=context
+            )
+
+        # Pin every classification request to one prompt_cache_key so OpenAI's
+        # server-side prompt caching reuses the constant system instruction +
+        # rendered intent table, cutting prefill cost and time-to-first-token.
+        # The intent table itself is rendered in sorted order (see
+        # LLMIntentClassifier._generate_context) to keep the prefix stable.
+        params = getattr(openai_llm, "default_request_params", None)
+        if params is not None:
+            params.metadata = {
+                "prompt_cache_key": PROMPT_CACHE_KEY,
+                **(params.metadata or {}),
+            }
 
         super().__init__(
             llm=openai_llm,
             intents=intents,
             classification_instruction=classification_instruction,
+            response_cache=response_cache,
+            semantic_cache=semantic_cache,
             context=context,
             **kwargs,
         )
@@ -49,6 +94,8 @@ class OpenAILLMIntentClassifier(LLMIntentClassifier):
         intents: List[Intent],
         classification_instruction: str | None = None,
         name: str | None = None,
+        response_cache: ResponseCache | None = None,
+        semantic_cache: SemanticCache | None = None,
         context: Optional["Context"] = None,
     ) -> "OpenAILLMIntentClassifier":
         """
@@ -60,6 +107,8 @@ class OpenAILLMIntentClassifier(LLMIntentClassifier):
             intents=intents,
             classification_instruction=classification_instruction,
             name=name,
+            response_cache=response_cache,
+            semantic_cache=semantic_cache,
             context=context,
         )
         await instance.initialize()
@@ -0,0 +1,90 @@
+from typing import Any, List, Tuple
+
+from numpy import float32, vstack
+from numpy.linalg import norm
+
+from mcp_agent.workflows.embedding.embedding_base import EmbeddingModel, FloatArray
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache for classification results.
+
+    Instead of requiring an exact string match, a lookup embeds the incoming
+    request and compares it against previously seen requests with a single
+    matrix-vector product. If the best cosine similarity clears the threshold,
+    the cached result is returned — converting a remote chat completion into a
+    local dot product for near-duplicate requests ("Tell me about Philadelphia"
+    vs "Talk to me about the city of Philadelphia").
+
+    Cached embeddings are stored as one contiguous float32 matrix rather than a
+    list of per-entry vectors, so the similarity scan vectorizes through BLAS.
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModel,
+        similarity_threshold: float = 0.92,
+        max_entries: int = 1024,
+    ):
+        """
+        Initialize the cache with an embedding model used to embed lookups,
+        the cosine similarity threshold for a hit, and a maximum number of
+        entries (oldest entries are evicted first).
+        """
+        self.embedding_model = embedding_model
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+
+        self._embeddings: FloatArray | None = None
+        """Matrix of cached embeddings, shape (N, D), rows L2-normalized"""
+
+        self._results: List[Any] = []
+        """Cached results, parallel to the embedding matrix rows"""
+
+    async def lookup(self, text: str) -> Tuple[FloatArray, Any | None]:
+        """
+        Embed the text and return (embedding, cached result or None).
+
+        The returned embedding can be passed to add() on a miss, so the text
+        is only embedded once per lookup/add cycle.
+        """
+        embeddings = await self.embedding_model.embed([text])
+        embedding = self._normalize(embeddings[0])
+
+        if self._embeddings is None:
+            return embedding, None
+
+        similarities = self._embeddings @ embedding
+        best = int(similarities.argmax())
+        if float(similarities[best]) >= self.similarity_threshold:
+            return embedding, self._results[best]
+
+        return embedding, None
+
+    def add(self, embedding: FloatArray, result: Any) -> None:
+        """
+        Record a new (embedding, result) pair, evicting the oldest entry
+        once max_entries is exceeded.
+        """
+        row = self._normalize(embedding).reshape(1, -1)
+        if self._embeddings is None:
+            self._embeddings = row
+        else:
+            self._embeddings = vstack([self._embeddings, row])
+        self._results.append(result)
+
+        if len(self._results) > self.max_entries:
+            self._embeddings = self._embeddings[1:]
+            self._results.pop(0)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @staticmethod
+    def _normalize(embedding: FloatArray) -> FloatArray:
+        vector = embedding.astype(float32)
+        magnitude = norm(vector)
+        if magnitude == 0:
+            return vector
+        return vector / magnitude
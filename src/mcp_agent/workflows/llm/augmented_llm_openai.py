@@ -6,7 +6,7 @@ from typing import Any, Dict, Iterable, List, Type, cast
 from pydantic import BaseModel
 
 
-from openai import OpenAI, AsyncOpenAI
+from openai import OpenAI, AsyncOpenAI, RateLimitError
 from openai.types.chat import (
     ChatCompletionAssistantMessageParam,
     ChatCompletionContentPartParam,
@@ -48,7 +48,12 @@ from mcp_agent.tracing.semconv import (
     GEN_AI_USAGE_OUTPUT_TOKENS,
 )
 from mcp_agent.tracing.telemetry import is_otel_serializable
-from mcp_agent.utils.common import ensure_serializable, typed_dict_extras
+from mcp_agent.utils.common import (
+    ensure_serializable,
+    json_dumps,
+    json_loads,
+    typed_dict_extras,
+)
 from mcp_agent.utils.mime_utils import image_url_to_mime_and_base64
 from mcp_agent.utils.pydantic_type_serializer import serialize_model, deserialize_model
 from mcp_agent.workflows.llm.augmented_llm import (
@@ -62,6 +67,7 @@ from mcp_agent.workflows.llm.augmented_llm import (
 )
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.workflows.llm.multipart_converter_openai import OpenAIConverter
+from mcp_agent.workflows.llm.rate_limiter import RateLimiter
 
 
 class RequestCompletionRequest(BaseModel):
@@ -78,6 +84,15 @@ class RequestStructuredCompletionRequest(BaseModel):
     user: str | None = None
 
 
+class RequestBatchCompletionRequest(BaseModel):
+    config: OpenAISettings
+    requests: List[dict]
+    """Entries of the form {"custom_id": ..., "body": <chat completion payload>}"""
+    completion_window: str = "24h"
+    poll_interval_seconds: float = 10.0
+    timeout_seconds: float | None = None
+
+
 class OpenAIAugmentedLLM(
     AugmentedLLM[ChatCompletionMessageParam, ChatCompletionMessage]
 ):
@@ -88,7 +103,11 @@ class OpenAIAugmentedLLM(
     """
 
     def __init__(self, *args, **kwargs):
+        # Optional shared RateLimiter to pace requests against provider quotas
+        # proactively instead of relying on 429 retries (see rate_limiter.py)
+        rate_limiter: RateLimiter | None = kwargs.pop("rate_limiter", None)
         super().__init__(*args, type_converter=MCPOpenAITypeConverter, **kwargs)
+        self.rate_limiter = rate_limiter
 
         self.provider = "OpenAI"
         # Initialize logger with name if available
@@ -148,6 +167,31 @@ class OpenAIAugmentedLLM(
 
         return ChatCompletionAssistantMessageParam(**assistant_message_params)
 
+    async def _throttle(self, payload: dict) -> None:
+        """Pace an outgoing completion request against the shared rate limiter."""
+        if self.rate_limiter is None:
+            return
+        max_tokens = (
+            payload.get("max_tokens") or payload.get("max_completion_tokens") or 0
+        )
+        est_tokens = self.rate_limiter.estimate_tokens(
+            str(payload.get("messages", "")), max_tokens
+        )
+        await self.rate_limiter.acquire(est_tokens)
+
+    def _record_rate_limit(self, error: BaseException) -> None:
+        """Drain the rate limiter when the provider reported a 429."""
+        if self.rate_limiter is None or not isinstance(error, RateLimitError):
+            return
+        retry_after = None
+        try:
+            retry_after = float(error.response.headers.get("retry-after"))
+        # pylint: disable=broad-exception-caught
+        except Exception:
+            # No usable retry-after hint; just empty the buckets
+            pass
+        self.rate_limiter.backoff(retry_after)
+
     async def generate(
         self,
         message,
@@ -260,6 +304,8 @@ class OpenAIAugmentedLLM(
 
                 self._annotate_span_for_completion_request(span, request, i)
 
+                await self._throttle(arguments)
+
                 response: ChatCompletion = await self.executor.execute(
                     OpenAICompletionTasks.request_completion_task,
                     ensure_serializable(request),
@@ -271,6 +317,7 @@ class OpenAIAugmentedLLM(
                 )
 
                 if isinstance(response, BaseException):
+                    self._record_rate_limit(response)
                     self.logger.error(f"Error: {response}")
                     span.record_exception(response)
                     span.set_status(trace.Status(trace.StatusCode.ERROR))
@@ -371,6 +418,164 @@ class OpenAIAugmentedLLM(
 
             return responses
 
+    async def build_request_payload(
+        self,
+        message,
+        request_params: RequestParams | None = None,
+        n: int | None = None,
+    ) -> dict:
+        """
+        Build a single-shot ChatCompletion payload (system prompt + message,
+        no history or tools) for this LLM. Used by the multi-sample and
+        Batch API paths, where each request must be self-contained.
+        """
+        params = self.get_request_params(request_params)
+
+        messages: List[ChatCompletionMessageParam] = []
+        system_prompt = self.instruction or params.systemPrompt
+        if system_prompt:
+            messages.append(
+                ChatCompletionSystemMessageParam(role="system", content=system_prompt)
+            )
+        messages.extend(OpenAIConverter.convert_mixed_messages_to_openai(message))
+
+        model = await self.select_model(params)
+
+        arguments = {
+            "model": model,
+            "messages": messages,
+        }
+
+        if n is not None:
+            arguments["n"] = n
+
+        user = params.user or getattr(self.context.config.openai, "user", None)
+        if user:
+            arguments["user"] = user
+
+        if params.stopSequences is not None:
+            arguments["stop"] = params.stopSequences
+
+        if self._reasoning(model):
+            arguments["max_completion_tokens"] = params.maxTokens
+            arguments["reasoning_effort"] = self._reasoning_effort
+        else:
+            arguments["max_tokens"] = params.maxTokens
+
+        if params.metadata:
+            arguments = {**arguments, **params.metadata}
+
+        return arguments
+
+    async def execute_batch(
+        self,
+        requests: List[dict],
+        completion_window: str = "24h",
+        poll_interval_seconds: float = 10.0,
+        timeout_seconds: float | None = None,
+    ) -> Dict[str, List[ChatCompletionMessage] | BaseException]:
+        """
+        Submit completion payloads to the OpenAI Batch API and demux the
+        results by custom_id once the batch completes.
+
+        Each request entry is {"custom_id": ..., "body": <completion payload>}
+        (see build_request_payload). Requests that fail inside the batch map
+        to an exception value rather than failing the whole call, mirroring
+        how execute_many reports partial failures in the online path. Batch
+        API usage is billed at a discount but completes asynchronously, so
+        this is intended for large, non-latency-sensitive workloads such as
+        offline evals.
+        """
+        response = await self.executor.execute(
+            OpenAICompletionTasks.request_batch_completion_task,
+            ensure_serializable(
+                RequestBatchCompletionRequest(
+                    config=self.context.config.openai,
+                    requests=requests,
+                    completion_window=completion_window,
+                    poll_interval_seconds=poll_interval_seconds,
+                    timeout_seconds=timeout_seconds,
+                )
+            ),
+        )
+
+        if isinstance(response, BaseException):
+            self.logger.error(f"Error: {response}")
+            raise response
+
+        results: Dict[str, List[ChatCompletionMessage] | BaseException] = {}
+        for custom_id, entry in response.items():
+            if entry.get("error"):
+                self.logger.error(
+                    f"Batch request '{custom_id}' failed: {entry['error']}"
+                )
+                results[custom_id] = RuntimeError(
+                    f"Batch request '{custom_id}' failed: {entry['error']}"
+                )
+                continue
+            completion = ChatCompletion.model_validate(entry["body"])
+            results[custom_id] = [choice.message for choice in completion.choices]
+        return results
+
+    async def generate_samples(
+        self,
+        message,
+        n: int,
+        request_params: RequestParams | None = None,
+    ) -> List[ChatCompletionMessage]:
+        """
+        Request n independent samples of the same message in a single
+        ChatCompletion call (the API's 'n' parameter), returning one response
+        message per sample.
+
+        This amortizes input-token cost and request overhead when several
+        identically-configured agents need independent completions of the same
+        prompt (e.g. a voting fan-out). This is a single-shot completion:
+        tool calls and history are not supported on this path.
+        """
+        tracer = get_tracer(self.context)
+        with tracer.start_as_current_span(
+            f"{self.__class__.__name__}.{self.name}.generate_samples"
+        ) as span:
+            self._annotate_span_for_generation_message(span, message)
+
+            params = self.get_request_params(request_params)
+
+            if self.context.tracing_enabled:
+                AugmentedLLM.annotate_span_with_request_params(span, params)
+                span.set_attribute("n", n)
+
+            arguments = await self.build_request_payload(
+                message, request_params=request_params, n=n
+            )
+            if arguments.get("model"):
+                span.set_attribute(GEN_AI_REQUEST_MODEL, arguments["model"])
+
+            request = RequestCompletionRequest(
+                config=self.context.config.openai,
+                payload=arguments,
+            )
+
+            self._annotate_span_for_completion_request(span, request, 0)
+
+            await self._throttle(arguments)
+
+            response: ChatCompletion = await self.executor.execute(
+                OpenAICompletionTasks.request_completion_task,
+                ensure_serializable(request),
+            )
+
+            if isinstance(response, BaseException):
+                self._record_rate_limit(response)
+                self.logger.error(f"Error: {response}")
+                span.record_exception(response)
+                span.set_status(trace.Status(trace.StatusCode.ERROR))
+                raise response
+
+            self._annotate_span_for_completion_response(span, response, 0)
+
+            return [choice.message for choice in response.choices]
+
     async def generate_str(
         self,
         message,
@@ -512,7 +717,7 @@ class OpenAIAugmentedLLM(
 
             try:
                 if tool_args_str:
-                    tool_args = json.loads(tool_args_str)
+                    tool_args = json_loads(tool_args_str)
             except json.JSONDecodeError as e:
                 span.record_exception(e)
                 span.set_status(trace.Status(trace.StatusCode.ERROR))
@@ -846,6 +1051,35 @@ class OpenAIAugmentedLLM(
         return attrs
 
 
+_openai_client_cache: Dict[tuple, OpenAI] = {}
+
+
+def _get_openai_client(config: OpenAISettings) -> OpenAI:
+    """
+    Return a shared OpenAI client for the given settings so repeated task
+    executions reuse the underlying HTTP connection pool (keeping TCP+TLS
+    sessions warm) instead of handshaking on every request. Configs that carry
+    a custom http_client or default_headers are not cached, since those
+    objects own their own lifecycle.
+    """
+    http_client = getattr(config, "http_client", None)
+    default_headers = getattr(config, "default_headers", None)
+    if http_client is not None or default_headers is not None:
+        return OpenAI(
+            api_key=config.api_key,
+            base_url=config.base_url,
+            http_client=http_client,
+            default_headers=default_headers,
+        )
+
+    key = (config.api_key, config.base_url)
+    client = _openai_client_cache.get(key)
+    if client is None:
+        client = OpenAI(api_key=config.api_key, base_url=config.base_url)
+        _openai_client_cache[key] = client
+    return client
+
+
 class OpenAICompletionTasks:
     @staticmethod
     @workflow_task
@@ -857,22 +1091,108 @@ class OpenAICompletionTasks:
         Request a completion from OpenAI's API.
         """
 
-        openai_client = OpenAI(
-            api_key=request.config.api_key,
-            base_url=request.config.base_url,
-            http_client=request.config.http_client
-            if hasattr(request.config, "http_client")
-            else None,
-            default_headers=request.config.default_headers
-            if hasattr(request.config, "default_headers")
-            else None,
-        )
+        openai_client = _get_openai_client(request.config)
 
         payload = request.payload
         response = openai_client.chat.completions.create(**payload)
         response = ensure_serializable(response)
         return response
 
+    @staticmethod
+    @workflow_task
+    @telemetry.traced()
+    async def request_batch_completion_task(
+        request: RequestBatchCompletionRequest,
+    ) -> Dict[str, dict]:
+        """
+        Submit a set of completion requests through OpenAI's Batch API and
+        poll until completion, returning response bodies keyed by custom_id.
+        """
+        import asyncio
+        import io
+        import time
+
+        openai_client = _get_openai_client(request.config)
+
+        jsonl = "\n".join(
+            json_dumps(
+                {
+                    "custom_id": entry["custom_id"],
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": entry["body"],
+                }
+            )
+            for entry in request.requests
+        )
+
+        batch_file = openai_client.files.create(
+            file=io.BytesIO(jsonl.encode("utf-8")), purpose="batch"
+        )
+        batch = openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=request.completion_window,
+        )
+
+        deadline = (
+            time.monotonic() + request.timeout_seconds
+            if request.timeout_seconds
+            else None
+        )
+        delay = request.poll_interval_seconds
+
+        while True:
+            batch = openai_client.batches.retrieve(batch.id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(
+                    f"Batch {batch.id} ended with status '{batch.status}'"
+                )
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Batch {batch.id} did not complete within "
+                    f"{request.timeout_seconds} seconds"
+                )
+            await asyncio.sleep(delay)
+            # Exponential backoff between polls, capped at one minute
+            delay = min(delay * 2, 60.0)
+
+        # Demux per custom_id, keeping failures as per-request entries instead
+        # of failing the whole batch: successes land in the output file while
+        # failed requests are written to the error file (and either file may
+        # be absent when all requests succeeded/failed).
+        results: Dict[str, dict] = {}
+
+        if batch.output_file_id:
+            output = openai_client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json_loads(line)
+                if entry.get("error"):
+                    results[entry["custom_id"]] = {"error": entry["error"]}
+                else:
+                    results[entry["custom_id"]] = {"body": entry["response"]["body"]}
+
+        if batch.error_file_id:
+            errors = openai_client.files.content(batch.error_file_id)
+            for line in errors.text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json_loads(line)
+                results.setdefault(entry["custom_id"], {"error": entry.get("error")})
+
+        # Requests absent from both files still get an explicit error entry
+        for entry in request.requests:
+            results.setdefault(
+                entry["custom_id"],
+                {"error": {"message": "No result returned by the Batch API"}},
+            )
+
+        return results
+
     @staticmethod
     @workflow_task
     @telemetry.traced()
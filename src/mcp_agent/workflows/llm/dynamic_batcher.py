@@ -0,0 +1,103 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Tuple, TypeVar
+
+from mcp_agent.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncDynamicBatcher(Generic[T, R]):
+    """
+    Coalesce concurrent requests into dynamic batches.
+
+    Callers submit individual items; a background drain task waits up to
+    batch_wait_timeout_s to accumulate up to max_batch_size pending items,
+    invokes flush(batch) once, and resolves each caller's future with the
+    corresponding element of the flush result. This amortizes per-request
+    overhead (HTTP round-trips, serialization, rate-limit slots) on endpoints
+    that accept list-valued inputs, such as embeddings.
+
+    flush receives the list of submitted items and must return a list of
+    results of the same length, in the same order.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[T]], Awaitable[List[R]]],
+        max_batch_size: int = 32,
+        batch_wait_timeout_s: float = 0.002,
+    ):
+        """
+        Initialize the batcher with the flush coroutine that services a batch,
+        the maximum number of items per batch, and how long to wait for more
+        items to arrive before flushing a partial batch.
+        """
+        self.flush = flush
+        self.max_batch_size = max_batch_size
+        self.batch_wait_timeout_s = batch_wait_timeout_s
+        self._queue: asyncio.Queue[Tuple[T, asyncio.Future]] = asyncio.Queue()
+        self._drain_task: asyncio.Task | None = None
+
+    async def submit(self, item: T) -> R:
+        """Submit one item and wait for its result from the batched flush."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        self._ensure_drain_task()
+        return await future
+
+    def _ensure_drain_task(self) -> None:
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        """Drain the queue into batches until no pending items remain."""
+        loop = asyncio.get_running_loop()
+
+        while not self._queue.empty():
+            batch: List[T] = []
+            futures: List[asyncio.Future] = []
+
+            item, future = await self._queue.get()
+            batch.append(item)
+            futures.append(future)
+
+            # Collect whatever else arrives within the batching window
+            deadline = loop.time() + self.batch_wait_timeout_s
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item, future = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                futures.append(future)
+
+            logger.debug(f"Flushing dynamic batch of {len(batch)} item(s)")
+
+            try:
+                results = await self.flush(batch)
+            # pylint: disable=broad-exception-caught
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            if results is None or len(results) != len(batch):
+                error = ValueError(
+                    f"flush returned {len(results) if results is not None else 0} "
+                    f"result(s) for a batch of {len(batch)}"
+                )
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+
+            for future, result in zip(futures, results):
+                if not future.done():
+                    future.set_result(result)
@@ -0,0 +1,127 @@
+import asyncio
+import time
+
+from mcp_agent.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenBucket:
+    """
+    A single async token bucket refilled at a fixed per-minute rate.
+
+    Callers await acquire(amount) and are paced so the sustained rate never
+    exceeds the bucket's per-minute budget, while short bursts up to the
+    bucket's capacity pass through without waiting.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.refill_rate = per_minute / 60.0
+        self._tokens = per_minute
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._last_refill) * self.refill_rate
+        )
+        self._last_refill = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until `amount` tokens are available, then consume them."""
+        # Refill is capped at capacity, so a larger request could never be
+        # satisfied; clamp it and pace it as one full-capacity request.
+        amount = min(amount, self.capacity)
+        while True:
+            async with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self.refill_rate
+            # Sleep outside the lock so other callers aren't blocked from
+            # checking (or draining) the bucket while we wait for a refill
+            await asyncio.sleep(wait)
+
+    def drain(self, refill_after_seconds: float | None = None) -> None:
+        """
+        Empty the bucket, optionally leaving it in deficit so that the next
+        acquire waits at least `refill_after_seconds`. Used when the provider
+        reports a rate-limit hit to stop in-flight callers from piling on.
+        """
+        self._refill()
+        self._tokens = 0
+        if refill_after_seconds is not None:
+            self._tokens = -refill_after_seconds * self.refill_rate
+
+
+class RateLimiter:
+    """
+    Proactive request/token throttle for LLM providers.
+
+    Rather than firing every fan-out request at once and burning time in
+    429/retry-after cycles, callers estimate their cost up front and
+    `await limiter.acquire(est_tokens)` before each request. A shared
+    limiter paces concurrent LLMs against the same provider quota.
+
+    Token costs are estimated with a ~4 characters/token heuristic (cached
+    per prompt), which is close enough for pacing purposes without taking
+    a tokenizer dependency.
+    """
+
+    # Rough average for English text across OpenAI tokenizers
+    _CHARS_PER_TOKEN = 4
+
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+    ):
+        """
+        Initialize the limiter with the provider quota to pace against.
+        Either budget may be omitted to leave that dimension unthrottled.
+        """
+        self._request_bucket = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self._token_bucket = (
+            TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        )
+        self._estimate_cache: dict[int, int] = {}
+
+    async def acquire(self, est_tokens: int = 0) -> None:
+        """Wait for one request slot plus `est_tokens` worth of token budget."""
+        if self._request_bucket is not None:
+            await self._request_bucket.acquire(1)
+        if self._token_bucket is not None and est_tokens:
+            await self._token_bucket.acquire(est_tokens)
+
+    def backoff(self, retry_after_seconds: float | None = None) -> None:
+        """
+        Drain both buckets after the provider signalled a rate-limit hit,
+        honoring its retry-after hint if one was given.
+        """
+        logger.debug(
+            f"Rate limit hit; draining buckets (retry_after={retry_after_seconds})"
+        )
+        if self._request_bucket is not None:
+            self._request_bucket.drain(retry_after_seconds)
+        if self._token_bucket is not None:
+            self._token_bucket.drain(retry_after_seconds)
+
+    def estimate_tokens(self, text: str, max_tokens: int = 0) -> int:
+        """
+        Estimate the token cost of a request: prompt length at ~4 chars/token
+        plus the completion budget. Cached by prompt so repeated estimates of
+        the same message are free.
+        """
+        key = hash(text)
+        prompt_tokens = self._estimate_cache.get(key)
+        if prompt_tokens is None:
+            prompt_tokens = len(text) // self._CHARS_PER_TOKEN + 1
+            if len(self._estimate_cache) > 4096:
+                self._estimate_cache.clear()
+            self._estimate_cache[key] = prompt_tokens
+        return prompt_tokens + max_tokens
@@ -0,0 +1,91 @@
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from mcp_agent.logging.logger import get_logger
+from mcp_agent.utils.common import json_dumps, json_loads
+
+logger = get_logger(__name__)
+
+
+class ResponseCache:
+    """
+    Exact-match cache for deterministic LLM calls.
+
+    Keys are content hashes over the request (message, model, parameters and
+    system instruction), so repeated identical calls short-circuit the network
+    round-trip entirely. An in-memory LRU tier sits in front of an optional
+    on-disk JSON tier that survives process restarts.
+
+    This is only appropriate for calls whose output is a pure function of the
+    request (e.g. classification or structured extraction). Do not use it for
+    requests that include conversation history.
+    """
+
+    def __init__(self, max_size: int = 1024, cache_dir: str | Path | None = None):
+        """
+        Initialize the cache with an in-memory LRU of max_size entries and,
+        if cache_dir is provided, a persistent on-disk tier in that directory.
+        """
+        self.max_size = max_size
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable cache key by hashing the string form of each part."""
+        hasher = hashlib.sha256()
+        for part in parts:
+            hasher.update(str(part).encode("utf-8"))
+            hasher.update(b"|")
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for the key, or None on a miss."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        if self.cache_dir:
+            path = self.cache_dir / f"{key}.json"
+            if path.exists():
+                try:
+                    value = json_loads(path.read_text())
+                # pylint: disable=broad-exception-caught
+                except Exception as e:
+                    # Best-effort: treat unreadable entries as misses
+                    logger.warning(f"Failed to read cached response {path}: {e}")
+                    return None
+                self._set_in_memory(key, value)
+                return value
+
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a JSON-serializable value under the key."""
+        self._set_in_memory(key, value)
+
+        if self.cache_dir:
+            path = self.cache_dir / f"{key}.json"
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+                with os.fdopen(fd, "w") as f:
+                    f.write(json_dumps(value))
+                # Atomic replace so concurrent readers never see partial writes
+                os.replace(tmp_path, path)
+            # pylint: disable=broad-exception-caught
+            except Exception as e:
+                # Best-effort: the in-memory tier still holds the value
+                logger.warning(f"Failed to persist cached response {path}: {e}")
+
+    def _set_in_memory(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
@@ -1,6 +1,7 @@
 import contextlib
+from collections import Counter
 from opentelemetry import trace
-from typing import Callable, Dict, List, Optional, Type, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Type, TYPE_CHECKING
 
 from mcp_agent.agents.agent import Agent
 from mcp_agent.core.context_dependent import ContextDependent
@@ -421,3 +422,108 @@ class FanIn(ContextDependent):
                     span.set_attribute(f"message.{i}", str(msg))
         else:
             span.set_attribute("message", str(message))
+
+
+class VoteAggregator:
+    """
+    Programmatic majority-vote fan-in for voting workflows.
+
+    For the voting pattern (N agents answering the same question with a
+    discrete label), aggregation is just a tally — delegating it to a fan-in
+    LLM adds a full LLM call per generate() for what is a counting reduction.
+    Pass an instance as ParallelLLM's fan_in_agent (it is detected through the
+    existing Callable fan-in path) to compute the winning label locally.
+    """
+
+    def __init__(
+        self,
+        label_extractor: Callable[[Any], str] | None = None,
+        weights: Dict[str, float] | None = None,
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            label_extractor: Maps one agent response to a vote label. The
+                default uses the message content (or the string itself),
+                stripped and lowercased.
+            weights: Optional per-agent vote weights, keyed by agent name.
+                Unlisted agents count as 1.0. Only applies to dict-shaped
+                fan-out results, where agent names are known.
+        """
+        self.label_extractor = label_extractor or self._default_label_extractor
+        self.weights = weights or {}
+        self._votes: Counter = Counter()
+
+    async def __call__(self, responses: FanInInput) -> str:
+        """Tally the votes and return the winning label."""
+        # Tally into a local counter so concurrent generate() calls on the
+        # same workflow don't interleave votes; the instance-level tally is
+        # reserved for the single-flight push()/finalize() protocol.
+        votes: Counter = Counter()
+        for agent_name, response in self._iter_responses(responses):
+            self._tally(agent_name, response, votes)
+        return self._winner(votes)
+
+    def push(self, agent_name: str, response: Any) -> None:
+        """
+        Tally one agent's response as it arrives. Together with finalize(),
+        this supports incremental fan-in (see ParallelLLM's incremental flag),
+        where votes are counted while slower agents are still generating.
+        Responses that are exceptions are skipped.
+        """
+        if isinstance(response, BaseException):
+            return
+        for name, msg in self._iter_responses({agent_name: response}):
+            self._tally(name, msg, self._votes)
+
+    def finalize(self) -> str:
+        """Return the winning label over the pushed votes and reset."""
+        winner = self._winner(self._votes)
+        self._votes.clear()
+        return winner
+
+    @staticmethod
+    def _winner(votes: Counter) -> str:
+        """Return the winning label of a tally."""
+        if not votes:
+            raise ValueError("No votes could be extracted from fan-out responses")
+
+        # most_common breaks ties by insertion (agent) order, which keeps the
+        # result deterministic for a given fan-out ordering
+        return votes.most_common(1)[0][0]
+
+    def _tally(self, agent_name: str, response: Any, votes: Counter) -> None:
+        """Add one response's label (if any) to the given vote count."""
+        label = self.label_extractor(response)
+        if label is None:
+            return
+        votes[label] += self.weights.get(agent_name, 1.0)
+
+    @staticmethod
+    def _iter_responses(responses: FanInInput):
+        """Yield (agent_name, single response) pairs from any FanInInput shape."""
+        if isinstance(responses, dict):
+            items = responses.items()
+        elif isinstance(responses, list):
+            items = ((str(i), response) for i, response in enumerate(responses))
+        else:
+            raise ValueError(
+                "Input must be either a dictionary of agent messages or a list of messages"
+            )
+
+        for name, response in items:
+            if isinstance(response, list):
+                for msg in response:
+                    yield name, msg
+            else:
+                yield name, response
+
+    @staticmethod
+    def _default_label_extractor(response: Any) -> str | None:
+        """Extract a normalized vote label from a message or string."""
+        content = getattr(response, "content", response)
+        if content is None:
+            return None
+        label = str(content).strip().lower()
+        return label or None
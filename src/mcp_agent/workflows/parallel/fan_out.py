@@ -1,7 +1,20 @@
+import asyncio
 import contextlib
 import functools
 from opentelemetry import trace
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Type, TYPE_CHECKING
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+)
 
 from mcp_agent.agents.agent import Agent
 from mcp_agent.core.context_dependent import ContextDependent
@@ -34,6 +47,11 @@ class FanOut(ContextDependent):
         agents: List[Agent | AugmentedLLM[MessageParamT, MessageT]] | None = None,
         functions: List[Callable[[MessageParamT], List[MessageT]]] | None = None,
         llm_factory: Callable[[Agent], AugmentedLLM[MessageParamT, MessageT]] = None,
+        max_concurrency: int | None = None,
+        coalesce_homogeneous: bool = False,
+        dedupe_identical: bool = False,
+        early_exit_fn: Callable[[Dict[str, Any]], bool] | None = None,
+        batch_mode: Literal["online", "batch"] = "online",
         context: Optional["Context"] = None,
         **kwargs,
     ):
@@ -41,23 +59,232 @@ class FanOut(ContextDependent):
         Initialize the FanOut with a list of agents, functions, or LLMs.
         If agents are provided, they will be wrapped in an AugmentedLLM using llm_factory if not already done so.
         If functions are provided, they will be invoked in parallel directly.
+        If max_concurrency is provided, at most that many fan-out tasks run at once.
+        This is useful to avoid tripping provider rate (RPM) limits on large fan-outs.
+        If coalesce_homogeneous is True, identically-configured LLMs (same class,
+        instruction and default request parameters) are served by a single
+        n-sample completion request in generate(), so the shared prompt is
+        billed once instead of once per agent.
+        If dedupe_identical is True, identically-configured LLMs issue a single
+        request and all of them receive the same response. Note this changes
+        voting semantics (agents no longer sample independently) — use
+        coalesce_homogeneous when independent samples are needed.
+        If early_exit_fn is provided, generate() checks it against the partial
+        results dict (agent name -> result) as each task completes and cancels
+        the remaining tasks once it returns True — e.g. a majority-vote
+        predicate can stop a 7-agent fan-out after 4 agreeing responses,
+        cutting tail latency and freeing rate-limit quota. It applies to
+        generate() only (generate_str() and generate_structured() always run
+        the full fan-out) and cannot be combined with coalesce_homogeneous,
+        dedupe_identical or batch_mode="batch", since the early-exit path
+        dispatches one live request per agent.
+        If batch_mode is "batch", generate() and generate_str() submit all agent
+        requests through the provider's Batch API in one discounted submission and
+        poll for the results. This trades latency for cost and is intended for
+        large non-interactive workloads (e.g. offline evals).
         """
         super().__init__(context=context, **kwargs)
         self.executor = self.context.executor
         self.llm_factory = llm_factory
         self.agents = agents or []
         self.functions: List[Callable[[MessageParamT], MessageT]] = functions or []
+        self.max_concurrency = max_concurrency
+        self.coalesce_homogeneous = coalesce_homogeneous
+        self.dedupe_identical = dedupe_identical
+        self.early_exit_fn = early_exit_fn
+        self.batch_mode = batch_mode
+        self._semaphore: asyncio.Semaphore | None = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
 
         if not self.agents and not self.functions:
             raise ValueError(
                 "At least one agent or function must be provided for fan-out to work"
             )
 
+        # The early-exit path streams one live request per agent, so it would
+        # silently skip these optimizations; reject the combination up front
+        # instead of quietly downgrading behavior.
+        if self.early_exit_fn is not None and (
+            self.coalesce_homogeneous
+            or self.dedupe_identical
+            or self.batch_mode == "batch"
+        ):
+            raise ValueError(
+                "early_exit_fn cannot be combined with coalesce_homogeneous, "
+                "dedupe_identical or batch_mode='batch'"
+            )
+
         if not self.llm_factory:
             for agent in self.agents:
                 if not isinstance(agent, AugmentedLLM):
                     raise ValueError("llm_factory is required when using an Agent")
 
+    def _apply_concurrency_limit(self, tasks):
+        """Wrap the fan-out tasks with the semaphore gate, if one is configured."""
+        if self._semaphore is None:
+            return tasks
+        return [self._run_with_semaphore(task) for task in tasks]
+
+    async def _run_with_semaphore(self, task):
+        """Run a single fan-out task (coroutine or sync callable) under the semaphore."""
+        async with self._semaphore:
+            if asyncio.iscoroutine(task):
+                return await task
+            # Sync callables still run off the event loop, matching executor behavior
+            result = await asyncio.to_thread(task)
+            # A callable may itself be async (e.g. a partial of an async
+            # function), in which case to_thread hands back its coroutine;
+            # await it like the executor does
+            if asyncio.iscoroutine(result):
+                result = await result
+            return result
+
+    @staticmethod
+    def _dedupe_key(agent) -> tuple | None:
+        """
+        Key identifying fan-out LLMs that would issue identical requests for
+        the same message (same class, instruction and default request
+        parameters), or None for agents that cannot be safely shared.
+        """
+        if not isinstance(agent, AugmentedLLM):
+            return None
+        params = agent.default_request_params
+        return (
+            type(agent).__name__,
+            agent.instruction,
+            params.model_dump_json() if params else None,
+        )
+
+    @classmethod
+    def _coalesce_key(cls, agent) -> tuple | None:
+        """
+        Key identifying fan-out LLMs that can share a single n-sample request,
+        or None if the agent cannot be coalesced (e.g. an Agent that needs its
+        own context, or an LLM without multi-sample support).
+        """
+        if not hasattr(agent, "generate_samples"):
+            return None
+        return cls._dedupe_key(agent)
+
+    def _coalesce_buckets(
+        self, exclude_ids: set | None = None
+    ) -> List[List[AugmentedLLM]]:
+        """
+        Group identically-configured LLMs into buckets of two or more agents.
+        Singleton buckets are dropped since they amortize nothing.
+        """
+        buckets: Dict[tuple, List[AugmentedLLM]] = {}
+        for agent in self.agents:
+            if exclude_ids and id(agent) in exclude_ids:
+                continue
+            key = self._coalesce_key(agent)
+            if key is not None:
+                buckets.setdefault(key, []).append(agent)
+        return [group for group in buckets.values() if len(group) > 1]
+
+    def _dedupe_followers(self) -> Dict[str, str]:
+        """
+        Map follower agent name -> leader agent name for identically-configured
+        LLMs. Followers skip dispatch and copy the leader's response.
+        """
+        leaders: Dict[tuple, str] = {}
+        followers: Dict[str, str] = {}
+        for agent in self.agents:
+            key = self._dedupe_key(agent)
+            if key is None:
+                continue
+            if key in leaders:
+                followers[agent.name] = leaders[key]
+            else:
+                leaders[key] = agent.name
+        return followers
+
+    async def _generate_coalesced(
+        self,
+        group: List[AugmentedLLM],
+        message: str | MessageParamT | List[MessageParamT],
+        request_params: RequestParams | None = None,
+    ) -> Dict[str, List[MessageT]]:
+        """
+        Issue one n=len(group) sampled request for a homogeneous bucket of LLMs
+        and splay one sample back to each agent's slot.
+        """
+        samples = await group[0].generate_samples(
+            message=message,
+            n=len(group),
+            request_params=request_params,
+        )
+        return {
+            agent.name: [samples[i]] if i < len(samples) else []
+            for i, agent in enumerate(group)
+        }
+
+    async def _generate_via_batch_api(
+        self,
+        message: str | MessageParamT | List[MessageParamT],
+        request_params: RequestParams | None = None,
+    ) -> Dict[str, List[MessageT]]:
+        """
+        Submit every agent's request as a single provider Batch API job and
+        demux the results by agent name. Requires all fan-out agents to be
+        pre-attached LLMs that expose the batch payload/execution hooks.
+        """
+        llms: List[AugmentedLLM] = []
+        for agent in self.agents:
+            if not isinstance(agent, AugmentedLLM) or not hasattr(
+                agent, "execute_batch"
+            ):
+                raise ValueError(
+                    f"Fan-out agent '{agent.name}' does not support batch_mode='batch'. "
+                    "Batch fan-out requires LLMs with Batch API support."
+                )
+            llms.append(agent)
+
+        requests = [
+            {
+                "custom_id": llm.name,
+                "body": await llm.build_request_payload(
+                    message=message, request_params=request_params
+                ),
+            }
+            for llm in llms
+        ]
+        return await llms[0].execute_batch(requests)
+
+    async def _run_functions(self, message) -> Dict[str, MessageT]:
+        """Run the plain-function fan-out tasks and return results by name."""
+        if not self.functions:
+            return {}
+        fn_tasks = [functools.partial(function, message) for function in self.functions]
+        fn_names = [function.__name__ or id(function) for function in self.functions]
+        fn_results = await self.executor.execute_many(
+            self._apply_concurrency_limit(fn_tasks)
+        )
+        return dict(zip(fn_names, fn_results))
+
+    async def _generate_with_early_exit(
+        self,
+        message: str | MessageParamT | List[MessageParamT],
+        request_params: RequestParams | None = None,
+    ) -> Dict[str, List[MessageT]]:
+        """
+        Collect fan-out results as they complete and cancel the remaining
+        tasks once early_exit_fn is satisfied, returning the partial results.
+        """
+        results: Dict[str, List[MessageT]] = {}
+        stream = self.generate_streaming(message=message, request_params=request_params)
+        async for name, result in stream:
+            results[name] = result
+            if self.early_exit_fn(results):
+                logger.debug(
+                    "Early-exit predicate satisfied; cancelling remaining fan-out tasks",
+                    data=list(results.keys()),
+                )
+                await stream.aclose()
+                break
+        return results
+
     async def generate(
         self,
         message: str | MessageParamT | List[MessageParamT],
@@ -75,6 +302,26 @@ class FanOut(ContextDependent):
             if self.context.tracing_enabled and request_params:
                 AugmentedLLM.annotate_span_with_request_params(span, request_params)
 
+            if self.batch_mode == "batch":
+                results = await self._generate_via_batch_api(message, request_params)
+                results.update(await self._run_functions(message))
+                return results
+
+            if self.early_exit_fn is not None:
+                return await self._generate_with_early_exit(message, request_params)
+
+            followers = self._dedupe_followers() if self.dedupe_identical else {}
+            follower_ids = {
+                id(agent) for agent in self.agents if agent.name in followers
+            }
+
+            buckets = (
+                self._coalesce_buckets(exclude_ids=follower_ids)
+                if self.coalesce_homogeneous
+                else []
+            )
+            coalesced_ids = {id(agent) for group in buckets for agent in group}
+
             tasks: List[
                 Callable[..., List[MessageT]] | Coroutine[Any, Any, List[MessageT]]
             ] = []
@@ -83,6 +330,9 @@ class FanOut(ContextDependent):
 
             async with contextlib.AsyncExitStack() as stack:
                 for agent in self.agents:
+                    if id(agent) in coalesced_ids or id(agent) in follower_ids:
+                        continue
+
                     if isinstance(agent, AugmentedLLM):
                         llm = agent
                     else:
@@ -103,16 +353,82 @@ class FanOut(ContextDependent):
                     tasks.append(functools.partial(function, message))
                     task_names.append(function.__name__ or id(function))
 
+                # One multi-sample task per homogeneous bucket
+                bucket_tasks = [
+                    self._generate_coalesced(group, message, request_params)
+                    for group in buckets
+                ]
+
                 span.set_attribute("task_names", task_names)
 
                 # Wait for all tasks to complete
                 logger.debug("Running fan-out tasks:", data=task_names)
-                task_results = await self.executor.execute_many(tasks)
+                task_results = await self.executor.execute_many(
+                    self._apply_concurrency_limit(tasks + bucket_tasks)
+                )
+
+            results = dict(zip(task_names, task_results))
+            for group, bucket_result in zip(buckets, task_results[len(task_names) :]):
+                if isinstance(bucket_result, BaseException):
+                    results.update({agent.name: bucket_result for agent in group})
+                else:
+                    results.update(bucket_result)
 
-            logger.debug(
-                "Fan-out tasks completed:", data=dict(zip(task_names, task_results))
-            )
-            return dict(zip(task_names, task_results))
+            # Scatter deduplicated responses back to the follower slots
+            for follower_name, leader_name in followers.items():
+                results[follower_name] = results[leader_name]
+
+            logger.debug("Fan-out tasks completed:", data=results)
+            return results
+
+    async def generate_streaming(
+        self,
+        message: str | MessageParamT | List[MessageParamT],
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[Tuple[str, List[MessageT] | BaseException]]:
+        """
+        Run the fan-out tasks and yield (name, result) pairs as each one
+        completes instead of waiting for the full set. Failed tasks yield
+        their exception as the result, mirroring execute_many. This lets an
+        incremental fan-in start aggregating while slower agents are still
+        generating (see ParallelLLM's incremental flag).
+        """
+        async with contextlib.AsyncExitStack() as stack:
+            pending: Dict[asyncio.Task, str] = {}
+
+            for agent in self.agents:
+                if isinstance(agent, AugmentedLLM):
+                    llm = agent
+                else:
+                    # Enter agent context
+                    ctx_agent = await stack.enter_async_context(agent)
+                    llm = await ctx_agent.attach_llm(self.llm_factory)
+
+                task = llm.generate(message=message, request_params=request_params)
+                if self._semaphore is not None:
+                    task = self._run_with_semaphore(task)
+                pending[asyncio.create_task(self.executor.execute(task))] = agent.name
+
+            for function in self.functions:
+                task = functools.partial(function, message)
+                if self._semaphore is not None:
+                    task = self._run_with_semaphore(task)
+                pending[asyncio.create_task(self.executor.execute(task))] = (
+                    function.__name__ or id(function)
+                )
+
+            try:
+                while pending:
+                    done, _ = await asyncio.wait(
+                        pending.keys(), return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for completed in done:
+                        name = pending.pop(completed)
+                        yield name, completed.result()
+            finally:
+                # Closed early (e.g. early exit): stop the outstanding tasks
+                for task in pending:
+                    task.cancel()
 
     async def generate_str(
         self,
@@ -135,12 +451,43 @@ class FanOut(ContextDependent):
             def fn_result_to_string(fn, message):
                 return str(fn(message))
 
+            if self.batch_mode == "batch":
+                llm_by_name = {agent.name: agent for agent in self.agents}
+                batch_results = await self._generate_via_batch_api(
+                    message, request_params
+                )
+                # Failed batch requests arrive as exception values; pass them
+                # through unchanged like execute_many does in the online path
+                results = {
+                    name: messages
+                    if isinstance(messages, BaseException)
+                    else "\n".join(
+                        llm_by_name[name].message_str(msg) for msg in messages
+                    )
+                    for name, messages in batch_results.items()
+                }
+                results.update(
+                    {
+                        name: str(result)
+                        for name, result in (await self._run_functions(message)).items()
+                    }
+                )
+                return results
+
+            followers = self._dedupe_followers() if self.dedupe_identical else {}
+            follower_ids = {
+                id(agent) for agent in self.agents if agent.name in followers
+            }
+
             tasks: List[Callable[..., str] | Coroutine[Any, Any, str]] = []
             task_names: List[str] = []
             task_results = []
 
             async with contextlib.AsyncExitStack() as stack:
                 for agent in self.agents:
+                    if id(agent) in follower_ids:
+                        continue
+
                     if isinstance(agent, AugmentedLLM):
                         llm = agent
                     else:
@@ -165,9 +512,14 @@ class FanOut(ContextDependent):
 
                 span.set_attribute("task_names", task_names)
 
-                task_results = await self.executor.execute_many(tasks)
+                task_results = await self.executor.execute_many(
+                    self._apply_concurrency_limit(tasks)
+                )
 
-            return dict(zip(task_names, task_results))
+            results = dict(zip(task_names, task_results))
+            for follower_name, leader_name in followers.items():
+                results[follower_name] = results[leader_name]
+            return results
 
     async def generate_structured(
         self,
@@ -191,12 +543,20 @@ class FanOut(ContextDependent):
             if self.context.tracing_enabled and request_params:
                 AugmentedLLM.annotate_span_with_request_params(span, request_params)
 
+            followers = self._dedupe_followers() if self.dedupe_identical else {}
+            follower_ids = {
+                id(agent) for agent in self.agents if agent.name in followers
+            }
+
             tasks = []
             task_names = []
             task_results = []
 
             async with contextlib.AsyncExitStack() as stack:
                 for agent in self.agents:
+                    if id(agent) in follower_ids:
+                        continue
+
                     if isinstance(agent, AugmentedLLM):
                         llm = agent
                     else:
@@ -220,9 +580,14 @@ class FanOut(ContextDependent):
 
                 span.set_attribute("task_names", task_names)
 
-                task_results = await self.executor.execute_many(tasks)
+                task_results = await self.executor.execute_many(
+                    self._apply_concurrency_limit(tasks)
+                )
 
-            return dict(zip(task_names, task_results))
+            results = dict(zip(task_names, task_results))
+            for follower_name, leader_name in followers.items():
+                results[follower_name] = results[leader_name]
+            return results
 
     def _annotate_span_for_generation_message(
         self,
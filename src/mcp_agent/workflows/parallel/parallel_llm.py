@@ -1,4 +1,4 @@
-from typing import Any, Callable, List, Optional, Type, TYPE_CHECKING
+from typing import Any, Callable, List, Literal, Optional, Type, TYPE_CHECKING
 
 from mcp_agent.agents.agent import Agent
 from mcp_agent.tracing.semconv import GEN_AI_AGENT_NAME
@@ -14,6 +14,7 @@ from mcp_agent.workflows.llm.augmented_llm import (
     ModelT,
     RequestParams,
 )
+from mcp_agent.workflows.llm.response_cache import ResponseCache
 from mcp_agent.workflows.parallel.fan_in import FanInInput, FanIn
 from mcp_agent.workflows.parallel.fan_out import FanOut
 
@@ -57,13 +58,40 @@ class ParallelLLM(AugmentedLLM[MessageParamT, MessageT]):
         fan_out_functions: List[Callable] | None = None,
         name: str | None = None,
         llm_factory: Callable[[Agent], AugmentedLLM] = None,
+        max_concurrency: int | None = None,
+        coalesce_homogeneous: bool = False,
+        dedupe_identical: bool = False,
+        early_exit_fn: Callable[[dict], bool] | None = None,
+        incremental: bool = False,
+        batch_mode: Literal["online", "batch"] = "online",
+        response_cache: ResponseCache | None = None,
         context: Optional["Context"] = None,
         **kwargs,
     ):
         """
         Initialize the LLM with a list of server names and an instruction.
         If a name is provided, it will be used to identify the LLM.
-        If an agent is provided, all other properties are optional
+        If an agent is provided, all other properties are optional.
+        If max_concurrency is provided, at most that many fan-out calls are
+        in flight at once (useful to stay under provider rate limits).
+        If coalesce_homogeneous is True, identically-configured fan-out LLMs
+        share a single multi-sample completion request (see FanOut).
+        If dedupe_identical is True, identically-configured fan-out LLMs issue
+        one request and share the response (see FanOut for the voting caveat).
+        If early_exit_fn is provided, the fan-out cancels outstanding agents
+        once the predicate over partial results is satisfied (see FanOut).
+        If incremental is True, fan-out responses are pushed into the fan-in
+        as they complete instead of after the full set arrives, hiding the
+        tail latency of the slowest agent. Requires a callable fan_in_agent
+        with push() and finalize() methods, such as VoteAggregator.
+        If batch_mode is "batch", the fan-out phase is submitted through the
+        provider's Batch API as one discounted job instead of live calls;
+        see FanOut for the trade-offs.
+        If response_cache is provided, generate_structured results are cached
+        by exact request so repeated identical calls skip the LLM round-trips
+        entirely. Caching only applies when the request explicitly disables
+        use_history (which defaults to True), and is only sound when the
+        fan-out agents are stateless.
         """
         super().__init__(
             name=name,
@@ -76,13 +104,15 @@ class ParallelLLM(AugmentedLLM[MessageParamT, MessageT]):
         self.fan_in_agent = fan_in_agent
         self.fan_out_agents = fan_out_agents
         self.fan_out_functions = fan_out_functions
+        self.response_cache = response_cache
         self.history = (
             None  # History tracking is complex in this workflow, so it is not supported
         )
 
         self.fan_in_fn: Callable[[FanInInput], Any] = None
         self.fan_in: FanIn = None
-        if isinstance(fan_in_agent, Callable):
+        # callable() is much cheaper than isinstance against typing.Callable
+        if callable(fan_in_agent):
             self.fan_in_fn = fan_in_agent
         else:
             self.fan_in = FanIn(
@@ -91,10 +121,26 @@ class ParallelLLM(AugmentedLLM[MessageParamT, MessageT]):
                 context=context,
             )
 
+        self.incremental = incremental
+        if incremental and not (
+            self.fan_in_fn is not None
+            and hasattr(self.fan_in_fn, "push")
+            and hasattr(self.fan_in_fn, "finalize")
+        ):
+            raise ValueError(
+                "Incremental fan-in requires a callable fan_in_agent with "
+                "push() and finalize() methods (e.g. VoteAggregator)"
+            )
+
         self.fan_out = FanOut(
             agents=fan_out_agents,
             functions=fan_out_functions,
             llm_factory=llm_factory,
+            max_concurrency=max_concurrency,
+            coalesce_homogeneous=coalesce_homogeneous,
+            dedupe_identical=dedupe_identical,
+            early_exit_fn=early_exit_fn,
+            batch_mode=batch_mode,
             context=context,
         )
 
@@ -113,6 +159,10 @@ class ParallelLLM(AugmentedLLM[MessageParamT, MessageT]):
                 if request_params:
                     AugmentedLLM.annotate_span_with_request_params(span, request_params)
 
+            if self.incremental:
+                span.set_attribute("incremental", True)
+                return await self._aggregate_incrementally(message, request_params)
+
             # First, we fan-out
             responses = await self.fan_out.generate(
                 message=message,
@@ -181,6 +231,14 @@ class ParallelLLM(AugmentedLLM[MessageParamT, MessageT]):
                 if request_params:
                     AugmentedLLM.annotate_span_with_request_params(span, request_params)
 
+            if self.incremental:
+                span.set_attribute("incremental", True)
+                result = str(
+                    await self._aggregate_incrementally(message, request_params)
+                )
+                span.set_attribute("response", result)
+                return result
+
             # First, we fan-out
             responses = await self.fan_out.generate(
                 message=message,
@@ -235,6 +293,15 @@ class ParallelLLM(AugmentedLLM[MessageParamT, MessageT]):
                 if request_params:
                     AugmentedLLM.annotate_span_with_request_params(span, request_params)
 
+            cache_key = self._structured_cache_key(
+                message, response_model, request_params
+            )
+            if cache_key is not None:
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    span.set_attribute("cache_hit", True)
+                    return response_model.model_validate(cached)
+
             # First, we fan-out
             responses = await self.fan_out.generate(
                 message=message,
@@ -268,6 +335,14 @@ class ParallelLLM(AugmentedLLM[MessageParamT, MessageT]):
                     request_params=request_params,
                 )
 
+            if cache_key is not None and result is not None:
+                try:
+                    self.response_cache.set(cache_key, result.model_dump(mode="json"))
+                # pylint: disable=broad-exception-caught
+                except Exception:
+                    # Best-effort: a non-serializable result is simply not cached
+                    pass
+
             if self.context.tracing_enabled:
                 try:
                     span.set_attribute(
@@ -278,3 +353,49 @@ class ParallelLLM(AugmentedLLM[MessageParamT, MessageT]):
                     pass  # Just no-op, best-effort tracing
 
             return result
+
+    async def _aggregate_incrementally(
+        self,
+        message: str | MessageParamT | List[MessageParamT],
+        request_params: RequestParams | None = None,
+    ) -> Any:
+        """
+        Push fan-out responses into the fan-in callable as they complete and
+        return its finalized aggregate. Overlaps aggregation with the network
+        wait on slower agents instead of blocking on the full response set.
+        """
+        async for agent_name, response in self.fan_out.generate_streaming(
+            message=message,
+            request_params=request_params,
+        ):
+            self.fan_in_fn.push(agent_name, response)
+        return self.fan_in_fn.finalize()
+
+    def _structured_cache_key(
+        self,
+        message: str | MessageParamT | List[MessageParamT],
+        response_model: Type[ModelT],
+        request_params: RequestParams | None,
+    ) -> str | None:
+        """
+        Build the exact-match cache key for a generate_structured call,
+        or return None if the call is not cacheable.
+        """
+        if self.response_cache is None:
+            return None
+
+        # RequestParams defaults use_history to True, so the fan-out agents
+        # resolve to keeping history unless the caller explicitly disables it.
+        # Only cache when history is explicitly off — otherwise the result
+        # depends on agent state beyond the message and caching is unsound.
+        if request_params is None or request_params.use_history:
+            return None
+
+        return ResponseCache.make_key(
+            message,
+            response_model.__name__,
+            self.instruction,
+            request_params.model_dump_json(exclude_unset=True)
+            if request_params
+            else "",
+        )
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from mcp_agent.utils.common import json_dumps, json_loads, to_string, unwrap
+
+
+class TestJsonHelpers:
+    """
+    Tests for the json_dumps/json_loads helpers.
+    """
+
+    def test_roundtrip_matches_stdlib(self):
+        """
+        Tests that a dumps/loads roundtrip preserves the value and agrees
+        with the stdlib regardless of which backend is installed.
+        """
+        value = {"a": 1, "b": [1.5, None, True], "c": "text"}
+
+        serialized = json_dumps(value)
+
+        assert json_loads(serialized) == value
+        assert json.loads(serialized) == value
+
+    def test_loads_accepts_bytes(self):
+        """
+        Tests that json_loads handles bytes input like the stdlib does.
+        """
+        assert json_loads(b'{"key": "value"}') == {"key": "value"}
+
+    def test_loads_invalid_json_raises_decode_error(self):
+        """
+        Tests that invalid input raises json.JSONDecodeError with either
+        backend, so existing except clauses keep working.
+        """
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("{not json")
+
+
+class TestExistingHelpers:
+    """
+    Smoke tests for the pre-existing common helpers.
+    """
+
+    def test_unwrap_plain_function(self):
+        """
+        Tests that unwrap returns a plain function unchanged.
+        """
+
+        def fn():
+            return None
+
+        assert unwrap(fn) is fn
+
+    def test_to_string_dict(self):
+        """
+        Tests that to_string serializes a plain dict to JSON.
+        """
+        assert json.loads(to_string({"x": 1})) == {"x": 1}
@@ -15,7 +15,9 @@ from mcp_agent.workflows.intent_classifier.intent_classifier_llm import (
 from mcp_agent.workflows.intent_classifier.intent_classifier_llm_openai import (
     OpenAILLMIntentClassifier,
     CLASSIFIER_SYSTEM_INSTRUCTION,
+    PROMPT_CACHE_KEY,
 )
+from mcp_agent.workflows.llm.augmented_llm import RequestParams
 
 
 class MockOpenAIAugmentedLLM:
@@ -469,3 +471,24 @@ class TestOpenAILLMIntentClassifier:
                 classifier.initialize.call_count == 2
             )  # Called, but should short-circuit internally
             assert classifier.initialized is True
+
+    # Test 13: Prompt cache key on request params
+    def test_prompt_cache_key_is_set_on_request_params(
+        self, test_intents, mock_context
+    ):
+        """
+        Tests that the classifier pins a stable prompt_cache_key on the LLM's
+        default request params without clobbering existing metadata.
+        """
+        llm = MockOpenAIAugmentedLLM(context=mock_context)
+        llm.default_request_params = RequestParams(metadata={"existing": "value"})
+
+        _ = OpenAILLMIntentClassifier(
+            llm=llm,
+            intents=test_intents,
+            context=mock_context,
+        )
+
+        metadata = llm.default_request_params.metadata
+        assert metadata["prompt_cache_key"] == PROMPT_CACHE_KEY
+        assert metadata["existing"] == "value"
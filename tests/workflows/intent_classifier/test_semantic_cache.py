@@ -0,0 +1,92 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from numpy import array, float32
+
+from mcp_agent.workflows.embedding.embedding_base import EmbeddingModel
+from mcp_agent.workflows.intent_classifier.semantic_cache import SemanticCache
+
+
+class TestSemanticCache:
+    """
+    Tests for the SemanticCache class.
+    """
+
+    @pytest.fixture
+    def mock_embedding_model(self):
+        """
+        Returns a mock EmbeddingModel that maps known texts to fixed vectors.
+        """
+        vectors = {
+            "tell me about philadelphia": [1.0, 0.0, 0.0],
+            "talk to me about the city of philadelphia": [0.99, 0.14, 0.0],
+            "schedule a meeting": [0.0, 1.0, 0.0],
+        }
+
+        async def embed(data):
+            return array(
+                [vectors.get(text, [0.0, 0.0, 1.0]) for text in data], dtype=float32
+            )
+
+        mock = MagicMock(spec=EmbeddingModel)
+        mock.embed = AsyncMock(side_effect=embed)
+        return mock
+
+    @pytest.fixture
+    def semantic_cache(self, mock_embedding_model):
+        """
+        Returns a SemanticCache with the mock embedding model.
+        """
+        return SemanticCache(embedding_model=mock_embedding_model)
+
+    @pytest.mark.asyncio
+    async def test_lookup_on_empty_cache_misses(self, semantic_cache):
+        """
+        Tests that a lookup against an empty cache returns a miss.
+        """
+        embedding, result = await semantic_cache.lookup("tell me about philadelphia")
+        assert result is None
+        assert embedding is not None
+
+    @pytest.mark.asyncio
+    async def test_similar_request_hits(self, semantic_cache):
+        """
+        Tests that a semantically similar request returns the cached result.
+        """
+        embedding, _ = await semantic_cache.lookup("tell me about philadelphia")
+        semantic_cache.add(embedding, "city_info")
+
+        _, result = await semantic_cache.lookup(
+            "talk to me about the city of philadelphia"
+        )
+        assert result == "city_info"
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_request_misses(self, semantic_cache):
+        """
+        Tests that a semantically different request misses the cache.
+        """
+        embedding, _ = await semantic_cache.lookup("tell me about philadelphia")
+        semantic_cache.add(embedding, "city_info")
+
+        _, result = await semantic_cache.lookup("schedule a meeting")
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_eviction_of_oldest_entry(self, mock_embedding_model):
+        """
+        Tests that the oldest entry is evicted once max_entries is exceeded.
+        """
+        cache = SemanticCache(embedding_model=mock_embedding_model, max_entries=1)
+
+        embedding, _ = await cache.lookup("tell me about philadelphia")
+        cache.add(embedding, "city_info")
+
+        embedding, _ = await cache.lookup("schedule a meeting")
+        cache.add(embedding, "meeting")
+
+        assert len(cache) == 1
+        _, result = await cache.lookup("tell me about philadelphia")
+        assert result is None
+        _, result = await cache.lookup("schedule a meeting")
+        assert result == "meeting"
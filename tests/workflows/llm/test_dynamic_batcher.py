@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from mcp_agent.workflows.llm.dynamic_batcher import AsyncDynamicBatcher
+
+
+class TestAsyncDynamicBatcher:
+    """
+    Tests for the AsyncDynamicBatcher class.
+    """
+
+    @pytest.mark.asyncio
+    async def test_single_item_is_flushed(self):
+        """
+        Tests that a lone item is flushed and resolved.
+        """
+        flushed_batches = []
+
+        async def flush(batch):
+            flushed_batches.append(batch)
+            return [item.upper() for item in batch]
+
+        batcher = AsyncDynamicBatcher(flush=flush)
+        result = await batcher.submit("hello")
+
+        assert result == "HELLO"
+        assert flushed_batches == [["hello"]]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_share_one_flush(self):
+        """
+        Tests that concurrent submissions are coalesced into a single flush.
+        """
+        flushed_batches = []
+
+        async def flush(batch):
+            flushed_batches.append(batch)
+            return [item * 2 for item in batch]
+
+        batcher = AsyncDynamicBatcher(flush=flush, batch_wait_timeout_s=0.05)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+        assert results == [0, 2, 4, 6, 8]
+        assert len(flushed_batches) == 1
+        assert sorted(flushed_batches[0]) == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_splits_batches(self):
+        """
+        Tests that batches never exceed max_batch_size.
+        """
+        flushed_batches = []
+
+        async def flush(batch):
+            flushed_batches.append(batch)
+            return batch
+
+        batcher = AsyncDynamicBatcher(
+            flush=flush, max_batch_size=2, batch_wait_timeout_s=0.05
+        )
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+        assert results == [0, 1, 2, 3, 4]
+        assert all(len(batch) <= 2 for batch in flushed_batches)
+
+    @pytest.mark.asyncio
+    async def test_flush_error_propagates_to_callers(self):
+        """
+        Tests that a flush failure is raised to every caller in the batch.
+        """
+
+        async def flush(batch):
+            raise RuntimeError("flush failed")
+
+        batcher = AsyncDynamicBatcher(flush=flush, batch_wait_timeout_s=0.05)
+
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_mismatched_flush_result_length_raises(self):
+        """
+        Tests that a flush returning the wrong number of results raises.
+        """
+
+        async def flush(batch):
+            return batch[:-1]
+
+        batcher = AsyncDynamicBatcher(flush=flush)
+
+        with pytest.raises(ValueError):
+            await batcher.submit("a")
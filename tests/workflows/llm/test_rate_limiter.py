@@ -0,0 +1,135 @@
+import asyncio
+import time
+
+import pytest
+
+from mcp_agent.workflows.llm.rate_limiter import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """
+    Tests for the TokenBucket class.
+    """
+
+    @pytest.mark.asyncio
+    async def test_burst_within_capacity_does_not_block(self):
+        """
+        Tests that acquires within the bucket's capacity pass through immediately.
+        """
+        bucket = TokenBucket(per_minute=600)
+
+        start = time.monotonic()
+        for _ in range(10):
+            await bucket.acquire(1)
+
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill_when_empty(self):
+        """
+        Tests that an acquire on an empty bucket waits for tokens to refill.
+        """
+        bucket = TokenBucket(per_minute=6000)  # 100 tokens/sec
+        bucket.drain()
+
+        start = time.monotonic()
+        await bucket.acquire(5)
+
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_acquire_larger_than_capacity_is_clamped(self):
+        """
+        Tests that an acquire exceeding the bucket capacity is clamped to it
+        instead of waiting forever for a refill that can never satisfy it.
+        """
+        bucket = TokenBucket(per_minute=100)
+
+        await asyncio.wait_for(bucket.acquire(500), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_waiting_acquire_does_not_block_other_callers(self):
+        """
+        Tests that a caller sleeping for a refill releases the lock, so other
+        callers can still acquire once tokens are available.
+        """
+        bucket = TokenBucket(per_minute=6000)  # 100 tokens/sec
+        bucket.drain(refill_after_seconds=5)
+        waiter = asyncio.create_task(bucket.acquire(bucket.capacity))
+        await asyncio.sleep(0.01)
+
+        # Hand tokens back while the first caller is asleep; a second caller
+        # must be able to take them instead of queueing behind the sleep
+        bucket._tokens = 1
+        await asyncio.wait_for(bucket.acquire(1), timeout=1)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    @pytest.mark.asyncio
+    async def test_drain_with_retry_after_creates_deficit(self):
+        """
+        Tests that draining with a retry-after hint delays the next acquire
+        by at least that long.
+        """
+        bucket = TokenBucket(per_minute=60000)
+        bucket.drain(refill_after_seconds=0.05)
+
+        start = time.monotonic()
+        await bucket.acquire(1)
+
+        assert time.monotonic() - start >= 0.04
+
+
+class TestRateLimiter:
+    """
+    Tests for the RateLimiter class.
+    """
+
+    @pytest.mark.asyncio
+    async def test_unthrottled_limiter_never_blocks(self):
+        """
+        Tests that a limiter with no budgets acquires immediately.
+        """
+        limiter = RateLimiter()
+
+        start = time.monotonic()
+        await limiter.acquire(est_tokens=10_000_000)
+
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_backoff_delays_next_acquire(self):
+        """
+        Tests that backoff drains the buckets so the next acquire waits.
+        """
+        limiter = RateLimiter(requests_per_minute=60000)
+        limiter.backoff(retry_after_seconds=0.05)
+
+        start = time.monotonic()
+        await limiter.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    def test_estimate_tokens_uses_chars_heuristic(self):
+        """
+        Tests the ~4 chars/token estimate plus the completion budget.
+        """
+        limiter = RateLimiter()
+
+        estimate = limiter.estimate_tokens("x" * 400, max_tokens=100)
+
+        assert estimate == 400 // 4 + 1 + 100
+
+    def test_estimate_tokens_is_cached_per_prompt(self):
+        """
+        Tests that repeated estimates of the same prompt hit the cache.
+        """
+        limiter = RateLimiter()
+
+        first = limiter.estimate_tokens("same prompt")
+        second = limiter.estimate_tokens("same prompt")
+
+        assert first == second
+        assert len(limiter._estimate_cache) == 1
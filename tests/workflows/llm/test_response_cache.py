@@ -0,0 +1,79 @@
+from mcp_agent.workflows.llm.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """
+    Tests for the ResponseCache class.
+    """
+
+    def test_make_key_is_stable(self):
+        """
+        Tests that the same inputs always hash to the same key.
+        """
+        key_a = ResponseCache.make_key("message", "gpt-4o", 1024)
+        key_b = ResponseCache.make_key("message", "gpt-4o", 1024)
+        assert key_a == key_b
+
+    def test_make_key_differs_by_input(self):
+        """
+        Tests that different inputs hash to different keys.
+        """
+        key_a = ResponseCache.make_key("message", "gpt-4o")
+        key_b = ResponseCache.make_key("message", "gpt-4o-mini")
+        assert key_a != key_b
+
+    def test_get_returns_none_on_miss(self):
+        """
+        Tests that a miss returns None.
+        """
+        cache = ResponseCache()
+        assert cache.get(ResponseCache.make_key("unseen")) is None
+
+    def test_set_and_get_in_memory(self):
+        """
+        Tests the in-memory tier round-trip.
+        """
+        cache = ResponseCache()
+        key = ResponseCache.make_key("message")
+        cache.set(key, {"classifications": []})
+        assert cache.get(key) == {"classifications": []}
+
+    def test_lru_eviction(self):
+        """
+        Tests that the oldest entry is evicted once max_size is exceeded.
+        """
+        cache = ResponseCache(max_size=2)
+        keys = [ResponseCache.make_key(i) for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.set(key, {"value": i})
+
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[1]) == {"value": 1}
+        assert cache.get(keys[2]) == {"value": 2}
+
+    def test_lru_recency_is_updated_on_get(self):
+        """
+        Tests that getting an entry refreshes its recency.
+        """
+        cache = ResponseCache(max_size=2)
+        keys = [ResponseCache.make_key(i) for i in range(3)]
+        cache.set(keys[0], {"value": 0})
+        cache.set(keys[1], {"value": 1})
+
+        # Touch the first entry so the second becomes the eviction candidate
+        cache.get(keys[0])
+        cache.set(keys[2], {"value": 2})
+
+        assert cache.get(keys[0]) == {"value": 0}
+        assert cache.get(keys[1]) is None
+
+    def test_disk_tier_round_trip(self, tmp_path):
+        """
+        Tests that values persisted to disk are readable by a fresh instance.
+        """
+        key = ResponseCache.make_key("message", "gpt-4o")
+        cache = ResponseCache(cache_dir=tmp_path)
+        cache.set(key, {"classifications": [{"intent": "greeting"}]})
+
+        fresh_cache = ResponseCache(cache_dir=tmp_path)
+        assert fresh_cache.get(key) == {"classifications": [{"intent": "greeting"}]}
@@ -1,7 +1,9 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
-from mcp_agent.workflows.parallel.fan_in import FanIn
+from mcp_agent.workflows.parallel.fan_in import FanIn, VoteAggregator
 from mcp_agent.workflows.llm.augmented_llm import RequestParams
 
 
@@ -573,3 +575,139 @@ class TestFanIn:
 
         # Assert the result is an empty string
         assert result == ""
+
+
+class TestVoteAggregator:
+    """
+    Tests for the VoteAggregator class.
+    """
+
+    @pytest.mark.asyncio
+    async def test_majority_vote_from_dict_of_strings(self):
+        """
+        Tests that the most common label wins a simple majority vote.
+        """
+        aggregator = VoteAggregator()
+
+        result = await aggregator({"agent1": "Yes", "agent2": "yes", "agent3": "No"})
+
+        assert result == "yes"
+
+    @pytest.mark.asyncio
+    async def test_vote_from_list_of_strings(self):
+        """
+        Tests voting over an unattributed list of responses.
+        """
+        aggregator = VoteAggregator()
+
+        result = await aggregator(["spam", "ham", "spam"])
+
+        assert result == "spam"
+
+    @pytest.mark.asyncio
+    async def test_weighted_vote_overrides_majority(self):
+        """
+        Tests that per-agent weights can outvote a numerical majority.
+        """
+        aggregator = VoteAggregator(weights={"expert": 3.0})
+
+        result = await aggregator({"expert": "no", "agent1": "yes", "agent2": "yes"})
+
+        assert result == "no"
+
+    @pytest.mark.asyncio
+    async def test_custom_label_extractor(self):
+        """
+        Tests that a custom label extractor is applied to each response.
+        """
+        aggregator = VoteAggregator(
+            label_extractor=lambda response: response.split(":")[0]
+        )
+
+        result = await aggregator(["safe: looks fine", "safe: ok", "unsafe: bad"])
+
+        assert result == "safe"
+
+    @pytest.mark.asyncio
+    async def test_vote_over_message_lists_uses_content(self):
+        """
+        Tests that dict values holding message lists vote with message content.
+        """
+
+        class FakeMessage:
+            def __init__(self, content):
+                self.content = content
+
+        aggregator = VoteAggregator()
+
+        result = await aggregator(
+            {
+                "agent1": [FakeMessage("approve")],
+                "agent2": [FakeMessage("approve")],
+                "agent3": [FakeMessage("reject")],
+            }
+        )
+
+        assert result == "approve"
+
+    @pytest.mark.asyncio
+    async def test_no_extractable_votes_raises(self):
+        """
+        Tests that an input with no usable labels raises a ValueError.
+        """
+        aggregator = VoteAggregator()
+
+        with pytest.raises(ValueError):
+            await aggregator({"agent1": [], "agent2": []})
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_tally_independently(self):
+        """
+        Tests that concurrent __call__ invocations don't interleave votes.
+        """
+        aggregator = VoteAggregator()
+
+        results = await asyncio.gather(
+            aggregator({"a1": "yes", "a2": "yes"}),
+            aggregator({"b1": "no", "b2": "no"}),
+        )
+
+        assert results == ["yes", "no"]
+
+    @pytest.mark.asyncio
+    async def test_push_and_finalize_incremental_votes(self):
+        """
+        Tests incremental tallying via push() and finalize().
+        """
+        aggregator = VoteAggregator()
+
+        aggregator.push("agent1", "yes")
+        aggregator.push("agent2", "yes")
+        aggregator.push("agent3", "no")
+
+        assert aggregator.finalize() == "yes"
+
+    @pytest.mark.asyncio
+    async def test_push_skips_exception_responses(self):
+        """
+        Tests that failed fan-out responses pushed as exceptions are ignored.
+        """
+        aggregator = VoteAggregator()
+
+        aggregator.push("agent1", "no")
+        aggregator.push("agent2", RuntimeError("agent failed"))
+
+        assert aggregator.finalize() == "no"
+
+    @pytest.mark.asyncio
+    async def test_finalize_resets_state_between_rounds(self):
+        """
+        Tests that finalize() clears the tally for the next round of votes.
+        """
+        aggregator = VoteAggregator()
+
+        aggregator.push("agent1", "yes")
+        assert aggregator.finalize() == "yes"
+
+        aggregator.push("agent1", "no")
+        assert aggregator.finalize() == "no"
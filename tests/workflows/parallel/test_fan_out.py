@@ -166,6 +166,21 @@ class TestFanOut:
         ):
             FanOut(agents=[mock_agent_with_name], context=mock_context)
 
+    def test_init_early_exit_with_coalesce_raises(
+        self, mock_context, mock_llm_with_name
+    ):
+        """
+        Tests that early_exit_fn combined with an optimization the early-exit
+        path cannot honor raises a ValueError instead of silently downgrading.
+        """
+        with pytest.raises(ValueError, match="early_exit_fn cannot be combined"):
+            FanOut(
+                agents=[mock_llm_with_name],
+                coalesce_homogeneous=True,
+                early_exit_fn=lambda results: True,
+                context=mock_context,
+            )
+
     # Test 2: Core Method Tests
     @pytest.mark.asyncio
     async def test_generate_with_llms(
@@ -580,3 +595,218 @@ class TestFanOut:
         mock_llm_with_name.generate.assert_called_once_with(
             message=message, request_params=None
         )
+
+    # Test 4: Concurrency Limit Tests
+    def test_init_with_max_concurrency(self, mock_context, mock_llm_with_name):
+        """
+        Tests initialization with a max_concurrency limit.
+        """
+        fan_out = FanOut(
+            agents=[mock_llm_with_name],
+            max_concurrency=2,
+            context=mock_context,
+        )
+        assert fan_out.max_concurrency == 2
+        assert fan_out._semaphore is not None
+
+    @pytest.mark.asyncio
+    async def test_generate_with_max_concurrency(self, mock_context):
+        """
+        Tests that max_concurrency bounds the number of in-flight fan-out tasks.
+        """
+        import asyncio
+        from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM
+
+        mock_context.tracer = None
+        mock_context.tracing_enabled = False
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def tracked_generate(message=None, request_params=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return ["response"]
+
+        llms = []
+        for i in range(3):
+            llm = MagicMock(spec=AugmentedLLM)
+            llm.name = f"llm_{i}"
+            llm.generate = MagicMock(side_effect=tracked_generate)
+            llms.append(llm)
+
+        async def run_all(tasks):
+            return await asyncio.gather(*tasks)
+
+        mock_context.executor.execute_many = AsyncMock(side_effect=run_all)
+
+        fan_out = FanOut(agents=llms, max_concurrency=1, context=mock_context)
+
+        result = await fan_out.generate("Test message")
+
+        # All tasks completed, but never more than one at a time
+        assert result == {llm.name: ["response"] for llm in llms}
+        assert max_in_flight == 1
+
+    # Test 5: Homogeneous Coalescing Tests
+    @pytest.mark.asyncio
+    async def test_generate_coalesces_homogeneous_llms(self, mock_context):
+        """
+        Tests that identically-configured LLMs share one n-sample request.
+        """
+        import asyncio
+        from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM
+
+        mock_context.tracer = None
+        mock_context.tracing_enabled = False
+
+        llms = []
+        for i in range(3):
+            llm = MagicMock(spec=AugmentedLLM)
+            llm.name = f"voter_{i}"
+            llm.instruction = "You vote on the input."
+            llm.default_request_params = None
+            llm.generate_samples = AsyncMock(
+                return_value=["sample_0", "sample_1", "sample_2"]
+            )
+            llms.append(llm)
+
+        async def run_all(tasks):
+            return await asyncio.gather(*tasks)
+
+        mock_context.executor.execute_many = AsyncMock(side_effect=run_all)
+
+        fan_out = FanOut(agents=llms, coalesce_homogeneous=True, context=mock_context)
+        result = await fan_out.generate("Test message")
+
+        # Each agent got one of the samples from the shared request
+        assert result == {
+            "voter_0": ["sample_0"],
+            "voter_1": ["sample_1"],
+            "voter_2": ["sample_2"],
+        }
+
+        # Only the bucket leader issued a request, with n equal to the bucket size
+        llms[0].generate_samples.assert_called_once_with(
+            message="Test message", n=3, request_params=None
+        )
+        llms[1].generate_samples.assert_not_called()
+        llms[2].generate_samples.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generate_dedupes_identical_llms(self, mock_context):
+        """
+        Tests that identically-configured LLMs issue one request and share it.
+        """
+        import asyncio
+        from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM
+
+        mock_context.tracer = None
+        mock_context.tracing_enabled = False
+
+        llms = []
+        for i in range(3):
+            llm = MagicMock(spec=AugmentedLLM)
+            llm.name = f"judge_{i}"
+            llm.instruction = "You judge the input."
+            llm.default_request_params = None
+            llm.generate = AsyncMock(return_value=["shared response"])
+            llms.append(llm)
+
+        async def run_all(tasks):
+            return await asyncio.gather(*tasks)
+
+        mock_context.executor.execute_many = AsyncMock(side_effect=run_all)
+
+        fan_out = FanOut(agents=llms, dedupe_identical=True, context=mock_context)
+        result = await fan_out.generate("Test message")
+
+        # Every agent slot holds the leader's response
+        assert result == {
+            "judge_0": ["shared response"],
+            "judge_1": ["shared response"],
+            "judge_2": ["shared response"],
+        }
+
+        # Only the leader issued a request
+        llms[0].generate.assert_called_once_with(
+            message="Test message", request_params=None
+        )
+        llms[1].generate.assert_not_called()
+        llms[2].generate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generate_streaming_yields_results_as_completed(self, mock_context):
+        """
+        Tests that generate_streaming yields (name, result) pairs for all agents.
+        """
+        from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM
+
+        mock_context.tracer = None
+        mock_context.tracing_enabled = False
+
+        llms = []
+        for i in range(2):
+            llm = MagicMock(spec=AugmentedLLM)
+            llm.name = f"streamer_{i}"
+            llm.generate = AsyncMock(return_value=[f"response_{i}"])
+            llms.append(llm)
+
+        async def run_one(task):
+            return await task
+
+        mock_context.executor.execute = AsyncMock(side_effect=run_one)
+
+        fan_out = FanOut(agents=llms, context=mock_context)
+        results = {}
+        async for name, result in fan_out.generate_streaming("Test message"):
+            results[name] = result
+
+        assert results == {
+            "streamer_0": ["response_0"],
+            "streamer_1": ["response_1"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_generate_early_exit_cancels_stragglers(self, mock_context):
+        """
+        Tests that generate cancels remaining tasks once early_exit_fn is met.
+        """
+        import asyncio
+        from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM
+
+        mock_context.tracer = None
+        mock_context.tracing_enabled = False
+
+        fast_llms = []
+        for i in range(2):
+            llm = MagicMock(spec=AugmentedLLM)
+            llm.name = f"fast_{i}"
+            llm.generate = AsyncMock(return_value=["agree"])
+            fast_llms.append(llm)
+
+        async def never_finishes(**kwargs):
+            await asyncio.Event().wait()
+
+        slow_llm = MagicMock(spec=AugmentedLLM)
+        slow_llm.name = "slow"
+        slow_llm.generate = AsyncMock(side_effect=never_finishes)
+
+        async def run_one(task):
+            return await task
+
+        mock_context.executor.execute = AsyncMock(side_effect=run_one)
+
+        fan_out = FanOut(
+            agents=fast_llms + [slow_llm],
+            early_exit_fn=lambda results: len(results) >= 2,
+            context=mock_context,
+        )
+
+        result = await asyncio.wait_for(fan_out.generate("Test message"), timeout=2)
+
+        # Both fast agents answered; the hung agent was cancelled, not awaited
+        assert result == {"fast_0": ["agree"], "fast_1": ["agree"]}